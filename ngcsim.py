@@ -116,12 +116,14 @@ Results are saved to a CSV file with columns:
 - <measure1>, <measure2>, ...: Measured values from simulation
 
 The corner_id can be used to identify and re-simulate specific corners.
+Rows are written as simulations finish, so with -j N > 1 they are not
+necessarily in corner_id order.
 When using --keep-netlists, the corner netlists are saved with filenames
 matching their corner_id (e.g., c0001.sp, c0002.sp)
 
 DEPENDENCIES
 ------------
-- Python 3.6+
+- Python 3.7+
 - ngspice (must be in system PATH)
 
 AUTHOR & LICENSE
@@ -131,16 +133,37 @@ Free to use and modify.
 """
 
 import argparse
+import asyncio
+import bisect
 import csv
 import itertools
 import os
 import re
-import subprocess
 import sys
 import tempfile
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Tuple, Optional, Union
+
+# Configuration command embedded in a netlist comment: ** ngc_<cmd> <args>
+_NGC_RE = re.compile(rb'^\s*\*+\s*(ngc_\w+)\s+(.*?)\s*$')
+
+# Library specification of ngc_lib: libfile.ext or libfile.ext(key)
+_LIB_SPEC_RE = re.compile(r'^([^()]+)(?:\(([^)]+)\))?$')
+
+# Command line prefix of every simulation: ngspice in batch mode
+_NGSPICE_ARGV = ('ngspice', '-b')
+
+# Wall-clock time limit of a single simulation in seconds
+_SIM_TIME_LIMIT = 300
+
+# Limits of a joint measurement extraction: results are written once a
+# worker has collected this many outputs or this many bytes of output
+_EXTRACT_BATCH_CORNERS = 16
+_EXTRACT_BATCH_BYTES = 1 << 20
+
+# Fallback insertion point for .temp when the netlist has no analysis command
+_END_RE = re.compile(rb'^\s*\.end', re.IGNORECASE)
 
 
 class NgcConfig:
@@ -158,84 +181,167 @@ class NetlistParser:
     
     def __init__(self, netlist_path: str):
         self.netlist_path = netlist_path
-        self.lines: List[str] = []
+        self.lines: List[bytes] = []
         self.config = NgcConfig()
         
-    def parse(self) -> Tuple[List[str], NgcConfig]:
-        """Parse netlist and return lines and configuration."""
-        with open(self.netlist_path, 'r') as f:
-            self.lines = f.readlines()
+    def parse(self) -> Tuple[List[bytes], NgcConfig]:
+        """Parse netlist and return raw lines and configuration."""
+        with open(self.netlist_path, 'rb') as f:
+            buf = f.read()
+        
+        # Lines stay undecoded; the generator works on bytes. splitlines
+        # accepts \n, \r\n and \r endings like text mode did.
+        self.lines = buf.splitlines(keepends=True)
         
         for line in self.lines:
-            self._parse_config_line(line)
+            # Only ngc_ comment lines carrying a command with arguments
+            # match, and only those are decoded
+            match = _NGC_RE.match(line)
+            if match:
+                args = match.group(2).decode().split()
+                handler = self._DISPATCH.get(match.group(1).decode())
+                if handler and args:
+                    handler(self, args, line.decode())
         
         return self.lines, self.config
     
-    def _parse_config_line(self, line: str):
-        """Parse a single line for ngc_ configuration commands."""
-        stripped = line.strip()
-        
-        # Check if line is a comment
-        if not (stripped.startswith('*') or stripped.startswith('**')):
-            return
-        
-        # Remove comment markers and strip
-        content = stripped.lstrip('*').strip()
-        
-        if not content.startswith('ngc_'):
+    def _handle_param(self, args: List[str], line: str):
+        """Handle ngc_param <param_name> <value1> ... <valueN>."""
+        if len(args) < 2:
+            print(f"Warning: ngc_param requires name and at least one value: {line.strip()}")
             return
-        
-        parts = content.split()
-        if len(parts) < 2:
+        param_name = args[0]
+        param_values = args[1:]
+        self.config.params[param_name] = param_values
+    
+    def _handle_lib(self, args: List[str], line: str):
+        """Handle ngc_lib <library_file>[(<key>)] <corner1> ... <cornerN>."""
+        if len(args) < 2:
+            print(f"Warning: ngc_lib requires library file and at least one corner: {line.strip()}")
             return
         
-        cmd = parts[0]
-        args = parts[1:]
+        lib_spec = args[0]
+        corners = args[1:]
         
-        if cmd == 'ngc_param':
-            if len(args) < 2:
-                print(f"Warning: ngc_param requires name and at least one value: {line.strip()}")
-                return
-            param_name = args[0]
-            param_values = args[1:]
-            self.config.params[param_name] = param_values
-            
-        elif cmd == 'ngc_lib':
-            if len(args) < 2:
-                print(f"Warning: ngc_lib requires library file and at least one corner: {line.strip()}")
-                return
-            
-            lib_spec = args[0]
-            corners = args[1:]
-            
-            # Parse library file and optional key: libfile.ext or libfile.ext(key)
-            match = re.match(r'^([^()]+)(?:\(([^)]+)\))?$', lib_spec)
-            if match:
-                libfile = match.group(1)
-                key = match.group(2) if match.group(2) else None
-                self.config.libs[(libfile, key)] = corners
-            else:
-                print(f"Warning: Invalid library specification: {lib_spec}")
-                
-        elif cmd == 'ngc_temp':
-            self.config.temps = args
-            
-        elif cmd == 'ngc_out':
-            self.config.outputs = args
+        # Parse library file and optional key: libfile.ext or libfile.ext(key)
+        match = _LIB_SPEC_RE.match(lib_spec)
+        if match:
+            libfile = match.group(1)
+            key = match.group(2) if match.group(2) else None
+            self.config.libs[(libfile, key)] = corners
+        else:
+            print(f"Warning: Invalid library specification: {lib_spec}")
+    
+    def _handle_temp(self, args: List[str], line: str):
+        """Handle ngc_temp <temp1> ... <tempN>."""
+        self.config.temps = args
+    
+    def _handle_out(self, args: List[str], line: str):
+        """Handle ngc_out <measure1> ... <measureN>."""
+        self.config.outputs = args
+    
+    # ngc_ command -> handler
+    _DISPATCH = {
+        'ngc_param': _handle_param,
+        'ngc_lib': _handle_lib,
+        'ngc_temp': _handle_temp,
+        'ngc_out': _handle_out,
+    }
 
 
 class CornerGenerator:
     """Generates corner netlists from parsed configuration."""
     
-    def __init__(self, lines: List[str], config: NgcConfig, base_netlist: str):
+    def __init__(self, lines: List[bytes], config: NgcConfig, base_netlist: str):
         self.lines = lines
         self.config = config
         self.base_netlist = base_netlist
         
-    def generate_corners(self) -> List[Dict]:
-        """Generate all corner combinations."""
-        corners = []
+        # Lookup tables for the directives matched by the combined pattern
+        self._param_names = {name.encode().lower(): name for name in config.params}
+        # libfile -> [(lib, encoded key or None)]
+        self._lib_keys: Dict[bytes, List[Tuple[Tuple[str, Optional[str]], Optional[bytes]]]] = {}
+        for lib in config.libs:
+            key = lib[1].strip().encode() if lib[1] is not None else None
+            self._lib_keys.setdefault(lib[0].encode().lower(), []).append((lib, key))
+        
+        # One pattern matching every directive that may be rewritten; only the
+        # substituted value is captured and the rest of the line is sliced off
+        alternatives = []
+        if config.params:
+            names = b'|'.join(re.escape(name.encode()) for name in config.params)
+            alternatives.append(rb'\s*\.param\s+(?P<pname>' + names + rb')\s*=\s*(?P<pval>\S+)')
+        if config.libs:
+            libfiles = b'|'.join(re.escape(libfile.encode())
+                                 for libfile in {lib[0] for lib in config.libs})
+            alternatives.append(rb'\s*\.lib\s+.*/(?P<lfile>' + libfiles + rb')\s+(?P<lkey>\S+)')
+        alternatives.append(rb'(?P<temp>\s*\.temp(?=\s))')
+        alternatives.append(rb'(?P<analysis>\s*\.(?:tran|ac|dc|op)(?=\s))')
+        self._combined = re.compile(b'^(?:' + b'|'.join(alternatives) + b')', re.IGNORECASE)
+        
+        # The netlist structure is the same for every corner, so classify the
+        # lines once and keep only the edits each corner has to apply
+        # Line ending of the netlist, reused for the .temp lines written
+        self._eol = b'\n'
+        for line in lines:
+            content = line.rstrip(b'\r\n')
+            if len(content) < len(line):
+                self._eol = line[len(content):]
+                break
+        
+        self._edits: List[Tuple] = []
+        temp_insert_idx: Optional[int] = None
+        temp_found = False
+        for i, line in enumerate(lines):
+            match = self._combined.match(line)
+            if not match:
+                continue
+            kind = match.lastgroup
+            
+            if kind == 'pval':
+                param_name = self._param_names[match.group('pname').lower()]
+                start, end = match.span('pval')
+                self._edits.append(('param', i, param_name, line[:start], line[end:]))
+            elif kind == 'lkey':
+                current_key = match.group('lkey')
+                for lib, key in self._lib_keys[match.group('lfile').lower()]:
+                    if key is None or current_key == key:
+                        start, end = match.span('lkey')
+                        self._edits.append(('lib', i, lib, line[:start], line[end:]))
+                        break
+            elif kind == 'temp':
+                self._edits.append(('temp', i))
+                temp_found = True
+            elif not temp_found and temp_insert_idx is None:
+                # First analysis command without a preceding .temp
+                temp_insert_idx = i
         
+        # Without .temp or analysis command, insert before the last .end
+        # or, if there is none, append at the end of the netlist
+        self._temp_append: Optional[bytes] = None
+        if not temp_found and temp_insert_idx is None:
+            for i in range(len(lines) - 1, -1, -1):
+                if _END_RE.match(lines[i]):
+                    temp_insert_idx = i
+                    break
+            else:
+                # Separator needed if the last line has no line break
+                self._temp_append = (self._eol if lines and not lines[-1].endswith((b'\n', b'\r'))
+                                     else b'')
+        
+        # .temp is inserted by prefixing the line it has to precede
+        if temp_insert_idx is not None:
+            self._edits.append(('temp_before', temp_insert_idx))
+        
+    def count_corners(self) -> int:
+        """Return the number of corners generate_corners() yields."""
+        count = len(self.config.temps) if self.config.temps else 1
+        for values in itertools.chain(self.config.params.values(), self.config.libs.values()):
+            count *= len(values)
+        return count
+    
+    def generate_corners(self) -> Iterator[Dict]:
+        """Generate all corner combinations lazily."""
         # Build lists for cartesian product
         param_names = sorted(self.config.params.keys())
         param_values_list = [self.config.params[name] for name in param_names]
@@ -245,147 +351,145 @@ class CornerGenerator:
         
         temps = self.config.temps if self.config.temps else ['25']
         
-        # Generate all combinations
-        corner_id = 0
+        # Generate all combinations in a single product, temperature outermost
+        n_params = len(param_names)
+        combos = itertools.product(temps, *param_values_list, *lib_values_list)
         
-        for temp in temps:
-            param_combos = itertools.product(*param_values_list) if param_values_list else [()]
-            lib_combos = itertools.product(*lib_values_list) if lib_values_list else [()]
-            
-            for param_combo in param_combos:
-                for lib_combo in lib_combos:
-                    corner_id += 1
-                    corner = {
-                        'id': f'c{corner_id:04d}',
-                        'temperature': temp,
-                        'params': dict(zip(param_names, param_combo)) if param_names else {},
-                        'libs': dict(zip(lib_keys, lib_combo)) if lib_keys else {}
-                    }
-                    corners.append(corner)
-        
-        return corners
+        for corner_id, combo in enumerate(combos, 1):
+            yield {
+                'id': f'c{corner_id:04d}',
+                'temperature': combo[0],
+                'params': dict(zip(param_names, combo[1:1 + n_params])),
+                'libs': dict(zip(lib_keys, combo[1 + n_params:]))
+            }
     
     def create_corner_netlist(self, corner: Dict, output_path: str):
         """Create a netlist file for a specific corner."""
-        modified_lines = []
-        temp_inserted = False
+        modified_lines = self.lines.copy()
+        temp_line = f".temp {corner['temperature']}".encode() + self._eol
         
-        for line in self.lines:
-            # Skip ngc_ configuration lines (keep as comments)
-            stripped = line.strip()
-            if stripped.lstrip('*').strip().startswith('ngc_'):
-                modified_lines.append(line)
-                continue
-            
-            modified_line = line
-            
-            # Replace .param statements
-            for param_name, param_value in corner['params'].items():
-                pattern = r'^(\s*\.param\s+' + re.escape(param_name) + r'\s*=\s*)([^\s]+)(.*)'
-                match = re.match(pattern, modified_line, re.IGNORECASE)
-                if match:
-                    modified_line = f"{match.group(1)}{param_value}{match.group(3)}\n"
-            
-            # Replace .lib statements
-            for (libfile, key), corner_value in corner['libs'].items():
-                pattern = r'^(\s*\.lib\s+)(.*)/' + re.escape(libfile) + r'(\s+)(\S+)(.*)'
-                match = re.match(pattern, modified_line, re.IGNORECASE)
-                if match:
-                    path_part = match.group(2)
-                    whitespace = match.group(3)
-                    current_key = match.group(4)
-                    rest = match.group(5)
-                    
-                    # Check if key matches (if specified)
-                    if key is None or current_key.strip() == key.strip():
-                        modified_line = f"{match.group(1)}{path_part}/{libfile}{whitespace}{corner_value}{rest}\n"
-            
-            # Check if this line has a .temp statement - replace it
-            if re.match(r'^\s*\.temp\s', modified_line, re.IGNORECASE):
-                modified_line = f".temp {corner['temperature']}\n"
-                temp_inserted = True
-            
-            modified_lines.append(modified_line)
-            
-            # Insert temperature before first analysis command if not yet inserted
-            if not temp_inserted and re.match(r'^\s*\.(tran|ac|dc|op)\s', modified_line, re.IGNORECASE):
-                # Insert .temp before the analysis command
-                modified_lines[-1] = f".temp {corner['temperature']}\n"
-                modified_lines.append(modified_line)
-                temp_inserted = True
-        
-        # If temperature was never inserted, add it before .end
-        if not temp_inserted:
-            for i in range(len(modified_lines) - 1, -1, -1):
-                if re.match(r'^\s*\.end', modified_lines[i], re.IGNORECASE):
-                    modified_lines.insert(i, f".temp {corner['temperature']}\n")
-                    break
+        for edit in self._edits:
+            kind, i = edit[0], edit[1]
+            if kind == 'param':
+                modified_lines[i] = edit[3] + corner['params'][edit[2]].encode() + edit[4]
+            elif kind == 'lib':
+                modified_lines[i] = edit[3] + corner['libs'][edit[2]].encode() + edit[4]
+            elif kind == 'temp':
+                # Replace existing .temp statements
+                modified_lines[i] = temp_line
             else:
-                # No .end found, append at the end
-                modified_lines.append(f".temp {corner['temperature']}\n")
+                modified_lines[i] = temp_line + modified_lines[i]
         
-        # Write to file
-        with open(output_path, 'w') as f:
-            f.writelines(modified_lines)
+        if self._temp_append is not None:
+            modified_lines.append(self._temp_append + temp_line)
+        
+        # Write to file with a single system call
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, b''.join(modified_lines))
+        finally:
+            os.close(fd)
+
+
+def lib_column(lib: Tuple[str, Optional[str]]) -> str:
+    """Return the CSV column name for a (libfile, key) library."""
+    libfile, key = lib
+    return f'lib_{libfile}_{key}' if key else f'lib_{libfile}'
+
+
+def result_fieldnames(config: NgcConfig) -> List[str]:
+    """Return the CSV columns of a corner result, known before any simulation."""
+    return (['corner_id', 'temperature'] +
+            [f'param_{name}' for name in sorted(config.params)] +
+            [lib_column(lib) for lib in sorted(config.libs)] +
+            list(dict.fromkeys(config.outputs)))
 
 
 class SimulationRunner:
     """Runs ngspice simulations and extracts results."""
     
     def __init__(self, output_measures: List[str]):
-        self.output_measures = output_measures
-    
-    def run_simulation(self, netlist_path: str, corner: Dict) -> Dict:
-        """Run ngspice simulation and extract measurements."""
+        self.output_measures = list(dict.fromkeys(output_measures))
+        
+        # One pattern for all measures so the output is scanned only once
+        self._measure_names = {measure.encode().lower(): measure for measure in self.output_measures}
+        self._meas_re = None
+        if self.output_measures:
+            self._meas_re = re.compile(
+                rb'^[^\S\n]*(' + b'|'.join(re.escape(measure.encode()) for measure in self.output_measures) +
+                rb')[^\S\n]*=[^\S\n]*(\S+)', re.IGNORECASE | re.MULTILINE)
+    
+    async def run_simulation(self, netlist_path: str, corner: Dict) -> Union[bytes, str]:
+        """Run ngspice simulation and return its raw output, or the error type on failure."""
         try:
-            # Run ngspice
-            result = subprocess.run(
-                ['ngspice', '-b', netlist_path],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
+            # Run ngspice directly from the event loop
+            proc = await asyncio.create_subprocess_exec(
+                *_NGSPICE_ARGV, netlist_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
             )
+            try:
+                # Event loop timer, no thread is started for the timeout
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=_SIM_TIME_LIMIT)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
             
-            # Parse output for measurements
-            measurements = self._extract_measurements(result.stdout)
-            
-            # Combine corner info with measurements
-            output = {
-                'corner_id': corner['id'],
-                'temperature': corner['temperature'],
-                **{f'param_{k}': v for k, v in corner['params'].items()},
-                **{f'lib_{lib[0]}{"_"+lib[1] if lib[1] else ""}': v 
-                   for lib, v in corner['libs'].items()},
-                **measurements
-            }
-            
-            return output
+            return stdout
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             print(f"Warning: Simulation timeout for corner {corner['id']}")
-            return self._create_error_result(corner, "TIMEOUT")
+            return "TIMEOUT"
         except Exception as e:
             print(f"Warning: Simulation error for corner {corner['id']}: {e}")
-            return self._create_error_result(corner, "ERROR")
+            return "ERROR"
     
-    def _extract_measurements(self, output: str) -> Dict[str, str]:
-        """Extract measurement values from ngspice output."""
-        measurements = {}
+    def create_results(self, corners: List[Dict], outputs: List[Union[bytes, str]]) -> List[Dict]:
+        """Create result dictionaries for a batch of corners from their simulation outputs."""
+        logs = [output for output in outputs if isinstance(output, bytes)]
+        measurements = iter(self._extract_measurements(logs))
         
-        for measure in self.output_measures:
-            # Pattern: measure_name = value
-            pattern = r'^\s*' + re.escape(measure) + r'\s*=\s*(\S+)'
-            
-            for line in output.split('\n'):
-                match = re.match(pattern, line, re.IGNORECASE)
-                if match:
-                    measurements[measure] = match.group(1)
-                    break
+        results = []
+        for corner, output in zip(corners, outputs):
+            if isinstance(output, bytes):
+                # Combine corner info with measurements
+                results.append({
+                    'corner_id': corner['id'],
+                    'temperature': corner['temperature'],
+                    **{f'param_{k}': v for k, v in corner['params'].items()},
+                    **{lib_column(lib): v for lib, v in corner['libs'].items()},
+                    **next(measurements)
+                })
+            else:
+                results.append(self._create_error_result(corner, output))
+        
+        return results
+    
+    def _extract_measurements(self, outputs: List[bytes]) -> List[Dict[str, str]]:
+        """Extract measurement values from a batch of raw ngspice outputs."""
+        found: List[Dict[str, str]] = [{} for _ in outputs]
+        
+        if self._meas_re and outputs:
+            # Scan all outputs as one buffer. The newline separator keeps each
+            # output's first line anchored, and matches are mapped back to
+            # their output through its start offset.
+            starts = []
+            offset = 0
+            for output in outputs:
+                starts.append(offset)
+                offset += len(output) + 1
             
-            if measure not in measurements:
-                measurements[measure] = 'N/A'
+            # Pattern: measure_name = value, first occurrence wins
+            for match in self._meas_re.finditer(b'\n'.join(outputs)):
+                measures = found[bisect.bisect_right(starts, match.start()) - 1]
+                measure = self._measure_names[match.group(1).lower()]
+                if measure not in measures:
+                    # Only the value itself is decoded, never the whole log
+                    measures[measure] = match.group(2).decode(errors='replace')
         
-        return measurements
+        return [{measure: measures.get(measure, 'N/A') for measure in self.output_measures}
+                for measures in found]
     
     def _create_error_result(self, corner: Dict, error_type: str) -> Dict:
         """Create result dictionary for failed simulation."""
@@ -393,8 +497,7 @@ class SimulationRunner:
             'corner_id': corner['id'],
             'temperature': corner['temperature'],
             **{f'param_{k}': v for k, v in corner['params'].items()},
-            **{f'lib_{lib[0]}{"_"+lib[1] if lib[1] else ""}': v 
-               for lib, v in corner['libs'].items()},
+            **{lib_column(lib): v for lib, v in corner['libs'].items()},
         }
         
         for measure in self.output_measures:
@@ -403,11 +506,57 @@ class SimulationRunner:
         return result
 
 
-def run_corner_simulation(args: Tuple) -> Dict:
-    """Worker function for parallel simulation execution."""
-    netlist_path, corner, output_measures = args
+# Corner generator shared by all tasks of a netlist pool worker
+_worker_generator: Optional[CornerGenerator] = None
+
+
+def init_netlist_worker(generator: CornerGenerator):
+    """Pool initializer: receive the corner generator once per worker."""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def write_corner_netlist(corner: Dict):
+    """Worker function for parallel netlist generation."""
+    _worker_generator.create_corner_netlist(corner, corner['netlist_path'])
+
+
+async def run_simulations(generator: CornerGenerator, corners: Iterator[Dict],
+                          output_measures: List[str], parallel: int,
+                          write_result: Callable[[Dict], None]):
+    """Generate and simulate corners with at most `parallel` ngspice processes."""
     runner = SimulationRunner(output_measures)
-    return runner.run_simulation(netlist_path, corner)
+    
+    async def worker():
+        # Outputs waiting for a joint measurement extraction
+        batch: List[Dict] = []
+        outputs: List[Union[bytes, str]] = []
+        size = 0
+        
+        def flush():
+            nonlocal size
+            for result in runner.create_results(batch, outputs):
+                write_result(result)
+            batch.clear()
+            outputs.clear()
+            size = 0
+        
+        # Take the next corner from the shared lazy iterator whenever the
+        # previous simulation is done, so only `parallel` tasks ever exist
+        for corner in corners:
+            # Netlists are written just before their simulation starts
+            generator.create_corner_netlist(corner, corner['netlist_path'])
+            output = await runner.run_simulation(corner['netlist_path'], corner)
+            batch.append(corner)
+            outputs.append(output)
+            size += len(output)
+            if len(batch) >= _EXTRACT_BATCH_CORNERS or size >= _EXTRACT_BATCH_BYTES:
+                flush()
+        
+        if batch:
+            flush()
+    
+    await asyncio.gather(*(worker() for _ in range(parallel)))
 
 
 def main():
@@ -467,26 +616,37 @@ def main():
         print("  ⚠ Warning: No ngc_ configuration found - will run single simulation at 25°C")
     
     generator = CornerGenerator(lines, config, args.netlist)
-    corners = generator.generate_corners()
-    print(f"  - Total corners to simulate: {len(corners)}")
+    total = generator.count_corners()
+    print(f"  - Total corners to simulate: {total}")
     print()
     
     # Create temporary directory for netlists
     temp_dir = tempfile.mkdtemp(prefix='ngcsim_')
     print(f"[3/5] Creating corner netlists in: {temp_dir}")
     
-    netlist_paths = []
-    for corner in corners:
-        netlist_path = os.path.join(temp_dir, f"{corner['id']}.sp")
-        generator.create_corner_netlist(corner, netlist_path)
-        netlist_paths.append(netlist_path)
-        corner['netlist_path'] = netlist_path
+    netlist_prefix = os.path.join(temp_dir, '')
     
-    print(f"  - Created {len(netlist_paths)} netlist(s)")
-    print()
+    def corners():
+        """Yield corners lazily, each with the path of its netlist."""
+        for corner in generator.generate_corners():
+            corner['netlist_path'] = f"{netlist_prefix}{corner['id']}.sp"
+            yield corner
     
     # Check if we should skip simulation
     if args.no_run:
+        if args.parallel > 1:
+            with ProcessPoolExecutor(max_workers=args.parallel,
+                                     initializer=init_netlist_worker,
+                                     initargs=(generator,)) as executor:
+                chunksize = max(1, total // (4 * args.parallel))
+                for _ in executor.map(write_corner_netlist, corners(), chunksize=chunksize):
+                    pass
+        else:
+            for corner in corners():
+                generator.create_corner_netlist(corner, corner['netlist_path'])
+        
+        print(f"  - Created {total} netlist(s)")
+        print()
         print("[4/5] Skipping simulations (--no-run specified)")
         print()
         print("[5/5] No results to write (simulations not run)")
@@ -506,54 +666,35 @@ def main():
         print("╚═══════════════════════════════════════════════════════════════════════════╝")
         return
     
-    # Run simulations
-    print(f"[4/5] Running simulations (parallel jobs: {args.parallel})...")
-    results = []
-    
-    if args.parallel > 1:
-        # Parallel execution
-        with ProcessPoolExecutor(max_workers=args.parallel) as executor:
-            sim_args = [(corner['netlist_path'], corner, config.outputs) 
-                       for corner in corners]
-            futures = [executor.submit(run_corner_simulation, arg) for arg in sim_args]
-            
-            completed = 0
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    results.append(result)
-                    completed += 1
-                    if completed % max(1, len(corners) // 20) == 0:
-                        print(f"  - Progress: {completed}/{len(corners)} ({100*completed//len(corners)}%)")
-                except Exception as e:
-                    print(f"  - Simulation failed: {e}")
-    else:
-        # Sequential execution
-        for i, corner in enumerate(corners):
-            runner = SimulationRunner(config.outputs)
-            result = runner.run_simulation(corner['netlist_path'], corner)
-            results.append(result)
-            
-            if (i + 1) % max(1, len(corners) // 20) == 0:
-                print(f"  - Progress: {i+1}/{len(corners)} ({100*(i+1)//len(corners)}%)")
-    
-    print(f"  - Completed {len(results)} simulation(s)")
+    print("  - Each netlist is created just before its simulation starts")
     print()
     
-    # Sort results by corner_id
-    results.sort(key=lambda x: x['corner_id'])
+    # Run simulations, writing each result to the CSV as soon as it arrives
+    print(f"[4/5] Running simulations (parallel jobs: {args.parallel})...")
+    print(f"  - Streaming results to: {output_file}")
+    completed = 0
     
-    # Write results to CSV
-    print(f"[5/5] Writing results to: {output_file}")
-    if results:
-        fieldnames = list(results[0].keys())
+    with open(output_file, 'w', newline='', buffering=1 << 16) as f:
+        writer = csv.DictWriter(f, fieldnames=result_fieldnames(config), extrasaction='ignore')
+        writer.writeheader()
         
-        with open(output_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
+        def write_result(result: Dict):
+            nonlocal completed
+            writer.writerow(result)
+            completed += 1
+            if completed % max(1, total // 20) == 0:
+                print(f"  - Progress: {completed}/{total} ({100*completed//total}%)")
         
-        print(f"  - Wrote {len(results)} corner result(s)")
+        parallel = max(1, args.parallel)
+        asyncio.run(run_simulations(generator, corners(), config.outputs,
+                                    parallel, write_result))
+    
+    print(f"  - Completed {completed} simulation(s)")
+    print()
+    
+    print(f"[5/5] Results written to: {output_file}")
+    if completed:
+        print(f"  - Wrote {completed} corner result(s)")
     else:
         print("  - No results to write")
     